@@ -16,6 +16,7 @@ Requirements: pip install hidapi
 Usage:
   python msi_mystic_light_bricker.py          # Interactive brick mode
   python msi_mystic_light_bricker.py --list   # List all MSI RGB devices
+  python msi_mystic_light_bricker.py --yes    # Brick without the confirmation prompt
 """
 
 import hid
@@ -38,8 +39,27 @@ LDROM_PID = 0x3F00
 CMD_GOTO_LDROM = 0xA0
 CMD_ERASE_ALL = 0xA3
 
-# Global to track which device we're working with
-current_device = None
+# Bootloader re-enumeration wait (seconds)
+BOOTLOADER_TIMEOUT = 6.0
+BOOTLOADER_POLL_INTERVAL = 0.1
+
+# Upper bound on waiting for the bootloader to acknowledge erase (ms)
+ERASE_TIMEOUT_MS = 3000
+
+# Pre-built 65-byte output reports (report ID, command, zero padding)
+GOTO_LDROM_REPORT = bytes([0x01, CMD_GOTO_LDROM]) + bytes(63)
+ERASE_ALL_REPORT = bytes([0x00, CMD_ERASE_ALL]) + bytes(63)
+
+def scan_devices():
+    """Enumerate all HID devices once, indexed by (VID, PID)
+    
+    One bus walk serves every known VID/PID lookup, where a filtered
+    hid.enumerate() per ID would repeat the walk for each of them.
+    """
+    found = {}
+    for d in hid.enumerate():
+        found.setdefault((d['vendor_id'], d['product_id']), []).append(d)
+    return found
 
 def print_banner():
     print("=" * 60)
@@ -62,10 +82,11 @@ def list_all_devices():
     print()
     
     found_any = False
+    found = scan_devices()
     
     # Check all known APROM devices
     for vid, pid, name in APROM_DEVICES:
-        devices = hid.enumerate(vid, pid)
+        devices = found.get((vid, pid), [])
         for d in devices:
             found_any = True
             print(f"[APROM] {name}")
@@ -76,7 +97,7 @@ def list_all_devices():
             print()
     
     # Check LDROM (bootloader)
-    devices = hid.enumerate(LDROM_VID, LDROM_PID)
+    devices = found.get((LDROM_VID, LDROM_PID), [])
     for d in devices:
         found_any = True
         print(f"[LDROM] Nuvoton ISP Bootloader")
@@ -98,12 +119,12 @@ def list_all_devices():
 
 def find_device():
     """Find MSI Mystic Light controller"""
-    global current_device
     print("[*] Searching for MSI Mystic Light controller...")
+    found = scan_devices()
     
     # Check all known APROM devices
     for vid, pid, name in APROM_DEVICES:
-        devices = hid.enumerate(vid, pid)
+        devices = found.get((vid, pid), [])
         if devices:
             d = devices[0]
             print(f"[+] Found: {name}")
@@ -111,69 +132,71 @@ def find_device():
             print(f"    Manufacturer: {d.get('manufacturer_string', 'N/A')}")
             print(f"    Product: {d.get('product_string', 'N/A')}")
             print(f"    Serial: {d.get('serial_number', 'N/A')}")
-            current_device = (vid, pid, name)
             return 'APROM', d['path']
     
     # Check LDROM mode
-    devices = hid.enumerate(LDROM_VID, LDROM_PID)
+    devices = found.get((LDROM_VID, LDROM_PID), [])
     if devices:
         d = devices[0]
         print(f"[+] Found in LDROM mode: VID=0x{LDROM_VID:04X} PID=0x{LDROM_PID:04X}")
         print(f"    Manufacturer: {d.get('manufacturer_string', 'N/A')}")
         print(f"    Product: {d.get('product_string', 'N/A')}")
-        current_device = (LDROM_VID, LDROM_PID, "Nuvoton ISP")
         return 'LDROM', d['path']
     
     print("[-] No MSI Mystic Light controller found!")
     return None, None
 
-def enter_bootloader():
-    """Switch from APROM to LDROM (bootloader) mode"""
-    global current_device
+def enter_bootloader(path):
+    """Switch from APROM to LDROM (bootloader) mode
+    
+    Returns the HID path of the bootloader device, or None on failure.
+    """
     print("[*] Entering bootloader mode...")
     
-    if not current_device:
+    if not path:
         print("[-] No device selected")
-        return False
-    
-    vid, pid, name = current_device
+        return None
     
     try:
         dev = hid.device()
-        dev.open(vid, pid)
+        dev.open_path(path)
         dev.set_nonblocking(0)
         
         # Send goto LDROM command (write method - works on Z890)
-        cmd = [0x01, CMD_GOTO_LDROM] + [0] * 63
-        dev.write(cmd)
+        result = dev.write(GOTO_LDROM_REPORT)
         dev.close()
         
+        if result <= 0:
+            print("[-] Bootloader command failed to send")
+            return None
+        
         print("[*] Command sent, waiting for device to re-enumerate...")
-        time.sleep(1)
         
-        # Wait for LDROM device to appear
-        for i in range(10):
+        # Poll for LDROM device to appear
+        start = time.monotonic()
+        deadline = start + BOOTLOADER_TIMEOUT
+        while time.monotonic() < deadline:
             devices = hid.enumerate(LDROM_VID, LDROM_PID)
             if devices:
-                print(f"[+] Bootloader appeared after {i * 0.5:.1f}s")
+                print(f"[+] Bootloader appeared after {time.monotonic() - start:.1f}s")
                 time.sleep(0.5)
-                return True
-            time.sleep(0.5)
+                return devices[0]['path']
+            time.sleep(BOOTLOADER_POLL_INTERVAL)
         
         print("[-] Timeout waiting for bootloader")
-        return False
+        return None
         
     except Exception as e:
         print(f"[-] Failed to enter bootloader: {e}")
-        return False
+        return None
 
-def erase_firmware():
-    """Erase the APROM firmware"""
+def erase_firmware(path):
+    """Erase the APROM firmware via the bootloader at the given HID path"""
     print("[*] Connecting to bootloader...")
     
     try:
         dev = hid.device()
-        dev.open(LDROM_VID, LDROM_PID)
+        dev.open_path(path)
         dev.set_nonblocking(0)
         
         mfg = dev.get_manufacturer_string()
@@ -181,20 +204,43 @@ def erase_firmware():
         serial = dev.get_serial_number_string()
         print(f"[+] Connected: {mfg} {prod} (Serial: {serial})")
         
+        # Drain queued input reports so any reply read later is the erase ack
+        dev.set_nonblocking(1)
+        for _ in range(16):
+            if not dev.read(64):
+                break
+        dev.set_nonblocking(0)
+        
         print()
         print("=" * 60)
         print("!!! SENDING ERASE COMMAND - POINT OF NO RETURN !!!")
         print("=" * 60)
         
         # Send erase all command
-        cmd = [0x00, CMD_ERASE_ALL] + [0] * 63
-        result = dev.write(cmd)
+        result = dev.write(ERASE_ALL_REPORT)
         
         if result > 0:
             print("[+] Erase command sent successfully")
             print("[*] Waiting for erase to complete...")
-            time.sleep(3)  # Flash erase takes time
-            print("[+] Erase complete!")
+            
+            # Bootloader replies once the erase has finished
+            start = time.monotonic()
+            try:
+                reply = dev.read(64, ERASE_TIMEOUT_MS)
+            except IOError:
+                reply = None
+            
+            if reply:
+                print("[+] Bootloader acknowledged erase")
+                print("[+] Erase complete!")
+            elif reply is None and not hid.enumerate(LDROM_VID, LDROM_PID):
+                print("[+] Bootloader left the bus - erase complete!")
+            else:
+                # No completion signal, so sit out the rest of the fixed wait
+                remaining = ERASE_TIMEOUT_MS / 1000 - (time.monotonic() - start)
+                if remaining > 0:
+                    time.sleep(remaining)
+                print(f"[*] No reply after {ERASE_TIMEOUT_MS / 1000:.0f}s, assuming erase finished")
         else:
             print("[-] Erase command failed to send")
             dev.close()
@@ -213,14 +259,16 @@ def verify_brick():
     print("[*] Verifying brick status...")
     time.sleep(2)
     
+    found = scan_devices()
+    
     # Check if any APROM device is still present
     aprom_found = False
     for vid, pid, name in APROM_DEVICES:
-        if hid.enumerate(vid, pid):
+        if found.get((vid, pid)):
             aprom_found = True
             break
     
-    ldrom_devices = hid.enumerate(LDROM_VID, LDROM_PID)
+    ldrom_devices = found.get((LDROM_VID, LDROM_PID), [])
     
     if not aprom_found:
         print("[+] APROM device no longer present - SUCCESS!")
@@ -241,6 +289,7 @@ def main():
 Examples:
   python msi_mystic_light_bricker.py          # Interactive brick mode
   python msi_mystic_light_bricker.py --list   # List all MSI RGB devices
+  python msi_mystic_light_bricker.py --yes    # Brick without the confirmation prompt
 
 Supported devices:
   - MSI Z890 Mystic Light (VID:0x1462 PID:0x7C70)
@@ -250,6 +299,8 @@ Supported devices:
     )
     parser.add_argument('--list', '-l', action='store_true',
                         help='List all detected MSI Mystic Light controllers')
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help="Skip the 'BRICK' confirmation prompt (for scripted use)")
     args = parser.parse_args()
     
     if args.list:
@@ -279,21 +330,25 @@ Supported devices:
     print("This action CANNOT be undone.")
     print()
     
-    confirm = input("Type 'BRICK' to proceed: ")
-    if confirm != 'BRICK':
-        print("\nAborted. Device unchanged.")
-        return 0
+    if args.yes:
+        print("[*] --yes given, skipping confirmation")
+    else:
+        confirm = input("Type 'BRICK' to proceed: ")
+        if confirm != 'BRICK':
+            print("\nAborted. Device unchanged.")
+            return 0
     
     print()
     
     # Enter bootloader if needed
     if mode == 'APROM':
-        if not enter_bootloader():
+        path = enter_bootloader(path)
+        if not path:
             print("\n[-] Failed to enter bootloader mode")
             return 1
     
     # Erase firmware
-    if not erase_firmware():
+    if not erase_firmware(path):
         print("\n[-] Erase operation failed")
         return 1
     
@@ -4,12 +4,28 @@
 
 :: Check if running as admin
 net session >nul 2>&1
-if %errorlevel% neq 0 (
-    echo Requesting administrator privileges...
+if %errorlevel% equ 0 goto :elevated
+
+:: Only the documented flags are forwarded, so no argument can break
+:: out of the PowerShell quoting used for the elevated relaunch
+set "ELEVATE_ARGS="
+for %%A in (%*) do (
+    call :add_elevate_arg "%%~A"
+    if errorlevel 1 (
+        pause
+        exit /b 1
+    )
+)
+
+echo Requesting administrator privileges...
+if defined ELEVATE_ARGS (
+    powershell -Command "Start-Process '%~f0' -Verb RunAs -ArgumentList '%ELEVATE_ARGS:~1%'"
+) else (
     powershell -Command "Start-Process '%~f0' -Verb RunAs"
-    exit /b
 )
+exit /b
 
+:elevated
 :: Change to script directory
 cd /d "%~dp0"
 
@@ -42,3 +58,16 @@ python msi_mystic_light_bricker.py %*
 :: Keep window open
 echo.
 pause
+exit /b
+
+:: Append a supported flag to ELEVATE_ARGS, or fail on anything else
+:add_elevate_arg
+for %%F in (--list -l --yes -y --help -h) do (
+    if /i "%~1"=="%%F" (
+        set "ELEVATE_ARGS=%ELEVATE_ARGS% %%F"
+        exit /b 0
+    )
+)
+echo ERROR: Unsupported argument: "%~1"
+echo Supported: --list, --yes, --help
+exit /b 1
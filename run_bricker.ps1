@@ -3,6 +3,7 @@
 
 param(
     [switch]$List,
+    [switch]$Yes,
     [switch]$Help
 )
 
@@ -14,6 +15,7 @@ if (-not $isAdmin) {
     $scriptPath = $MyInvocation.MyCommand.Path
     $args = @()
     if ($List) { $args += "-List" }
+    if ($Yes) { $args += "-Yes" }
     if ($Help) { $args += "-Help" }
     Start-Process powershell -Verb RunAs -ArgumentList "-NoProfile -ExecutionPolicy Bypass -File `"$scriptPath`" $args"
     exit
@@ -57,6 +59,7 @@ Write-Host ""
 # Build arguments
 $pyArgs = @()
 if ($List) { $pyArgs += "--list" }
+if ($Yes) { $pyArgs += "--yes" }
 if ($Help) { $pyArgs += "--help" }
 
 # Run the script